@@ -32,7 +32,7 @@ class Settings(BaseSettings):
 
     # Knowledge Graph Settings
     KG_STORAGE_PATH: str = "./data/graph"
-    KG_FORMAT: str = "turtle"  # RDF serialization format (turtle, xml, n3, etc.)
+    KG_FORMAT: str = "turtle"  # Ontology file serialization format (turtle, xml, n3, etc.)
 
     model_config = SettingsConfigDict(
         env_file=".env",
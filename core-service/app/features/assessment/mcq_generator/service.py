@@ -89,6 +89,16 @@ Always consider the learning path context to ensure questions build appropriatel
             ("human", "{user_prompt}")
         ])
 
+        self._learning_path_service = None  # Lazy load, shared across calls
+
+    @property
+    def learning_path_service(self):
+        """Lazy load the LearningPathService so its KG layers are built once per agent."""
+        if self._learning_path_service is None:
+            from app.features.learning_path.service import LearningPathService
+            self._learning_path_service = LearningPathService()
+        return self._learning_path_service
+
     def _build_user_prompt(
         self,
         concept_name: str,
@@ -225,10 +235,7 @@ Focus on creating questions that help learners verify they truly understand the
         # Fetch learning path if thread_id provided
         if learning_path_thread_id:
             try:
-                from app.features.learning_path.service import LearningPathService
-
-                lp_service = LearningPathService()
-                lp_data = await lp_service.get_learning_path_kg_info(
+                lp_data = await self.learning_path_service.get_learning_path_kg_info(
                     db, learning_path_thread_id
                 )
 
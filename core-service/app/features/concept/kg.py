@@ -1,6 +1,6 @@
 """Knowledge Graph operations for concepts."""
 
-from rdflib import URIRef
+from rdflib import Graph, URIRef
 from typing import Optional
 from app.kg.storage import KGStorage
 from app.kg.ontologies import ConceptOntology
@@ -36,42 +36,91 @@ class ConceptKG:
         Returns:
             URIRef of the created concept
         """
-        # Load existing concepts
-        concepts_graph = self.storage.load_concepts()
+        # Existing concept with no new prerequisites - nothing to write
+        if not prerequisites:
+            concepts_graph = self.storage.load_concepts(read_only=True)
+            concept_uri = self.ontology.get_concept_by_id(concepts_graph, concept_id)
+            if (concept_uri, None, None) in concepts_graph:
+                return concept_uri
         
-        # Check if concept already exists in the graph
-        concept_uri = self.ontology.get_concept_by_id(concepts_graph, concept_id)
-        concept_exists = (concept_uri, None, None) in concepts_graph
-        
-        if concept_exists:
-            # Concept exists - just add new prerequisites if provided
+        def apply(concepts_graph: Graph) -> URIRef:
+            # Check if concept already exists in the graph
+            concept_uri = self.ontology.get_concept_by_id(concepts_graph, concept_id)
+            
+            if (concept_uri, None, None) in concepts_graph:
+                # Concept exists - just add new prerequisites if provided
+                if prerequisites:
+                    self._add_prerequisites(concepts_graph, concept_uri, prerequisites)
+                    logger.info(f"Added prerequisites to existing concept: {concept_id}")
+                return concept_uri
+            
+            # Add new concept
+            concept = self.ontology.add_concept(
+                concepts_graph,
+                concept_id=concept_id,
+                label=label,
+                description=description
+            )
+            
+            # Add prerequisites if provided
             if prerequisites:
-                for prereq_id in prerequisites:
-                    prereq = self.ontology.get_concept_by_id(concepts_graph, prereq_id)
-                    self.ontology.add_prerequisite(concepts_graph, concept_uri, prereq)
-                self.storage.save_concepts(concepts_graph)
-                logger.info(f"Added prerequisites to existing concept: {concept_id}")
-            return concept_uri
+                self._add_prerequisites(concepts_graph, concept, prerequisites)
+            
+            logger.info(f"Created concept in KG: {concept_id}")
+            return concept
         
-        # Add new concept
-        concept = self.ontology.add_concept(
-            concepts_graph,
-            concept_id=concept_id,
-            label=label,
-            description=description
-        )
+        # Load, modify and save back to storage under the file lock
+        return self.storage.update_concepts(apply)
+    
+    def create_concepts_bulk(self, specs: list[dict]) -> list[URIRef]:
+        """
+        Create multiple concepts with a single load and save of the concepts graph.
         
-        # Add prerequisites if provided
-        if prerequisites:
-            for prereq_id in prerequisites:
-                prereq = self.ontology.get_concept_by_id(concepts_graph, prereq_id)
-                self.ontology.add_prerequisite(concepts_graph, concept, prereq)
+        All concepts are added before any prerequisites, so a spec may list
+        another concept from the same batch as a prerequisite regardless of order.
+        Existing concepts only get their new prerequisites, as in create_concept.
         
-        # Save back to storage
-        self.storage.save_concepts(concepts_graph)
-        logger.info(f"Created concept in KG: {concept_id}")
+        Args:
+            specs: Concept specs with keys "concept_id", "label" and optional
+                   "description" and "prerequisites" (list of concept IDs)
+            
+        Returns:
+            URIRefs of the concepts, in spec order
+        """
+        if not specs:
+            return []
         
-        return concept
+        def apply(concepts_graph: Graph) -> list[URIRef]:
+            # First pass: add concepts that don't exist yet
+            concepts = []
+            created = 0
+            for spec in specs:
+                concept_uri = self.ontology.get_concept_by_id(concepts_graph, spec["concept_id"])
+                if (concept_uri, None, None) not in concepts_graph:
+                    concept_uri = self.ontology.add_concept(
+                        concepts_graph,
+                        concept_id=spec["concept_id"],
+                        label=spec["label"],
+                        description=spec.get("description")
+                    )
+                    created += 1
+                concepts.append(concept_uri)
+            
+            # Second pass: link prerequisites
+            for concept_uri, spec in zip(concepts, specs):
+                if spec.get("prerequisites"):
+                    self._add_prerequisites(concepts_graph, concept_uri, spec["prerequisites"])
+            
+            logger.info(f"Created {created} of {len(specs)} concepts in KG (bulk)")
+            return concepts
+        
+        return self.storage.update_concepts(apply)
+    
+    def _add_prerequisites(self, concepts_graph: Graph, concept: URIRef, prerequisites: list[str]) -> None:
+        """Link a concept to each prerequisite concept ID."""
+        for prereq_id in prerequisites:
+            prereq = self.ontology.get_concept_by_id(concepts_graph, prereq_id)
+            self.ontology.add_prerequisite(concepts_graph, concept, prereq)
     
     def get_concept(self, concept_id: str) -> Optional[URIRef]:
         """
@@ -83,7 +132,7 @@ class ConceptKG:
         Returns:
             URIRef of the concept, or None if concepts graph is empty
         """
-        concepts_graph = self.storage.load_concepts()
+        concepts_graph = self.storage.load_concepts(read_only=True)
         if len(concepts_graph) == 0:
             return None
         return self.ontology.get_concept_by_id(concepts_graph, concept_id)
@@ -95,7 +144,7 @@ class ConceptKG:
         Returns:
             List of concept URIRefs
         """
-        concepts_graph = self.storage.load_concepts()
+        concepts_graph = self.storage.load_concepts(read_only=True)
         return self.ontology.get_all_concepts(concepts_graph)
     
     def get_concept_prerequisites(self, concept_id: str) -> list[URIRef]:
@@ -108,10 +157,29 @@ class ConceptKG:
         Returns:
             List of prerequisite concept URIRefs
         """
-        concepts_graph = self.storage.load_concepts()
+        concepts_graph = self.storage.load_concepts(read_only=True)
         concept = self.ontology.get_concept_by_id(concepts_graph, concept_id)
         return self.ontology.get_prerequisites(concepts_graph, concept)
     
+    def get_prerequisites_map(self, concept_ids: list[str]) -> dict[str, list[URIRef]]:
+        """
+        Get prerequisites for several concepts from a single graph load.
+        
+        Args:
+            concept_ids: The concept identifiers
+            
+        Returns:
+            Dict mapping each concept ID to its prerequisite concept URIRefs
+        """
+        concepts_graph = self.storage.load_concepts(read_only=True)
+        return {
+            concept_id: self.ontology.get_prerequisites(
+                concepts_graph,
+                self.ontology.get_concept_by_id(concepts_graph, concept_id)
+            )
+            for concept_id in concept_ids
+        }
+    
     def concept_exists(self, concept_id: str) -> bool:
         """
         Check if a concept exists in the KG.
@@ -122,7 +190,7 @@ class ConceptKG:
         Returns:
             True if concept exists, False otherwise
         """
-        concepts_graph = self.storage.load_concepts()
+        concepts_graph = self.storage.load_concepts(read_only=True)
         if len(concepts_graph) == 0:
             return False
         
@@ -51,6 +51,30 @@ class ConceptService:
         logger.info(f"Added concept: {concept_id}")
         return concept
     
+    def add_concepts_bulk(self, specs: List[Dict]) -> list[URIRef]:
+        """
+        Add multiple concepts, writing the concepts graph once.
+        
+        Business logic: Validates that every prerequisite either exists
+        already or is part of the same batch.
+        
+        Args:
+            specs: Concept specs with keys "concept_id", "label" and optional
+                   "description" and "prerequisites" (list of concept IDs)
+            
+        Returns:
+            URIRefs of the concepts, in spec order
+        """
+        batch_ids = {spec["concept_id"] for spec in specs}
+        for spec in specs:
+            for prereq_id in spec.get("prerequisites") or []:
+                if prereq_id not in batch_ids and not self.kg.concept_exists(prereq_id):
+                    raise ValueError(f"Prerequisite concept '{prereq_id}' does not exist")
+        
+        concepts = self.kg.create_concepts_bulk(specs)
+        logger.info(f"Added {len(concepts)} concepts")
+        return concepts
+    
     def create_concept_extended(
         self,
         concept_id: str,
@@ -172,14 +196,15 @@ class ConceptService:
         concept_uris = self.kg.get_all_concepts()
         concept_ids = [str(uri).split("#")[-1] for uri in concept_uris]
         
-        # Get metadata for all concepts
+        # Get metadata and prerequisites for all concepts
         all_metadata = self.storage.get_all_metadata()
+        prereq_map = self.kg.get_prerequisites_map(concept_ids)
         
         # Build concept list with metadata
         concepts = []
         for concept_id in concept_ids:
             metadata = all_metadata.get(concept_id, {})
-            prereq_uris = self.kg.get_concept_prerequisites(concept_id)
+            prereq_uris = prereq_map[concept_id]
             prereq_ids = [str(p).split("#")[-1] for p in prereq_uris]
             
             concept = {
@@ -316,3 +341,15 @@ class ConceptService:
             List of prerequisite concept URIRefs
         """
         return self.kg.get_concept_prerequisites(concept_id)
+    
+    def get_prerequisites_map(self, concept_ids: list[str]) -> dict[str, list[URIRef]]:
+        """
+        Get prerequisites for several concepts at once.
+        
+        Args:
+            concept_ids: The concept identifiers
+            
+        Returns:
+            Dict mapping each concept ID to its prerequisite concept URIRefs
+        """
+        return self.kg.get_prerequisites_map(concept_ids)
@@ -16,6 +16,18 @@ from ddgs import DDGS
 
 from .models import LearningContent
 
+# External API endpoints
+YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
+YOUTUBE_VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos"
+PERPLEXITY_CHAT_URL = "https://api.perplexity.ai/chat/completions"
+
+# Educational domains to prioritize (read-only)
+EDUCATIONAL_DOMAINS = (
+    'medium.com', 'dev.to', 'realpython.com', 'freecodecamp.org',
+    'codecademy.com', 'tutorialspoint.com', 'geeksforgeeks.org',
+    'w3schools.com', 'mdn.mozilla.org', 'stackoverflow.com'
+)
+
 
 class APIContentFetcher:
     """
@@ -35,6 +47,10 @@ class APIContentFetcher:
         self.youtube_api_key = self.api_keys.get('youtube') or os.getenv('YOUTUBE_API_KEY')
         self.perplexity_api_key = self.api_keys.get('perplexity') or os.getenv('PERPLEXITY_API_KEY')
         
+        # Shared HTTP session: keep-alive connections are reused across the
+        # per-video YouTube duration lookups and per-item Perplexity calls
+        self.session = requests.Session()
+        
         # Initialize Perplexity AI if available
         self.perplexity_enabled = False
         if self.perplexity_api_key:
@@ -42,11 +58,7 @@ class APIContentFetcher:
             print("[OK] Perplexity AI initialized for content analysis")
         
         # Educational domains to prioritize
-        self.educational_domains = [
-            'medium.com', 'dev.to', 'realpython.com', 'freecodecamp.org',
-            'codecademy.com', 'tutorialspoint.com', 'geeksforgeeks.org',
-            'w3schools.com', 'mdn.mozilla.org', 'stackoverflow.com'
-        ]
+        self.educational_domains = EDUCATIONAL_DOMAINS
 
     def fetch_youtube_content(self, query: str, max_results: int = 10) -> List[LearningContent]:
         """
@@ -60,7 +72,6 @@ class APIContentFetcher:
             return []
         
         try:
-            url = "https://www.googleapis.com/youtube/v3/search"
             params = {
                 'part': 'snippet',
                 'q': query,
@@ -72,17 +83,21 @@ class APIContentFetcher:
                 'relevanceLanguage': 'en'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(YOUTUBE_SEARCH_URL, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
+            items = data.get('items', [])
+            
+            # Get all video durations with a single API call
+            durations = self._get_youtube_durations([item['id']['videoId'] for item in items])
+            
             contents = []
-            for item in data.get('items', []):
+            for item in items:
                 video_id = item['id']['videoId']
                 snippet = item['snippet']
                 
-                # Get video duration and stats
-                duration = self._get_youtube_duration(video_id)
+                duration = durations.get(video_id, 0)
                 
                 content = LearningContent(
                     id=f"youtube_{video_id}",
@@ -115,36 +130,39 @@ class APIContentFetcher:
             print(f"[ERROR] YouTube fetch error: {e}")
             return []
 
-    def _get_youtube_duration(self, video_id: str) -> int:
-        """Get video duration in minutes from YouTube API."""
-        if not self.youtube_api_key:
-            return 0
+    def _get_youtube_durations(self, video_ids: List[str]) -> Dict[str, int]:
+        """
+        Get durations in minutes for several videos from one YouTube API call.
+        
+        The videos endpoint accepts up to 50 comma-separated IDs, so a page of
+        search results costs one request instead of one per video.
+        """
+        if not self.youtube_api_key or not video_ids:
+            return {}
 
+        durations = {}
         try:
-            url = "https://www.googleapis.com/youtube/v3/videos"
             params = {
                 'part': 'contentDetails',
-                'id': video_id,
+                'id': ','.join(video_ids[:50]),
                 'key': self.youtube_api_key
             }
 
-            response = requests.get(url, params=params, timeout=5)
+            response = self.session.get(YOUTUBE_VIDEOS_URL, params=params, timeout=5)
             response.raise_for_status()
             data = response.json()
 
-            if data.get('items'):
-                duration_str = data['items'][0]['contentDetails']['duration']
+            for item in data.get('items', []):
                 # Parse ISO 8601 duration (e.g., "PT15M30S")
-                minutes = self._parse_duration(duration_str)
-                return minutes
+                durations[item['id']] = self._parse_duration(item['contentDetails']['duration'])
         except requests.exceptions.RequestException as e:
             # Log network/API errors but don't fail
-            print(f"YouTube duration API error for {video_id}: {e}")
+            print(f"YouTube duration API error for {video_ids}: {e}")
         except (KeyError, IndexError, ValueError) as e:
             # Log parsing errors
-            print(f"YouTube duration parse error for {video_id}: {e}")
+            print(f"YouTube duration parse error for {video_ids}: {e}")
 
-        return 0
+        return durations
 
     def _parse_duration(self, duration: str) -> int:
         """Parse ISO 8601 duration to minutes."""
@@ -179,7 +197,10 @@ class APIContentFetcher:
             
             for feed_url in feed_urls:
                 try:
-                    feed = feedparser.parse(feed_url)
+                    # Fetch with a timeout; feedparser's own URL fetching has none
+                    response = self.session.get(feed_url, timeout=10)
+                    response.raise_for_status()
+                    feed = feedparser.parse(response.content)
                     
                     for entry in feed.entries[:max_results]:
                         # Extract clean text from HTML summary
@@ -377,8 +398,8 @@ Return ONLY valid JSON with these exact keys."""
                 'max_tokens': 500
             }
             
-            response = requests.post(
-                'https://api.perplexity.ai/chat/completions',
+            response = self.session.post(
+                PERPLEXITY_CHAT_URL,
                 headers=headers,
                 json=payload,
                 timeout=10
@@ -17,6 +17,7 @@ from app.features.users.preferences import ContentInteraction
 from .schemas import DashboardStatsResponse, RecentActivity, QuickAction
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+uk_service = UserKnowledgeService()
 
 
 @router.get("/stats", response_model=DashboardStatsResponse)
@@ -44,7 +45,6 @@ async def get_dashboard_stats(
     active_paths = result.scalar() or 0
     
     # 2. Get concepts learned count (from user knowledge service)
-    uk_service = UserKnowledgeService()
     try:
         uk_dashboard = await uk_service.get_user_knowledge_dashboard(
             user_id=str(user_id),
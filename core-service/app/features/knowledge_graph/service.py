@@ -36,13 +36,19 @@ class KnowledgeGraphService:
         all_concept_uris = self.concept_service.get_all_concepts()
         
         # Get user's known and learning concepts
-        known_uris = self.user_knowledge_service.get_user_known_concepts(user_id)
-        learning_uris = self.user_knowledge_service.get_user_learning_concepts(user_id)
+        state = self.user_knowledge_service.get_user_state(user_id)
+        known_uris = state["known"]
+        learning_uris = state["learning"]
         
         # Convert to sets for faster lookup
         known_ids = {str(uri).split("#")[-1] for uri in known_uris}
         learning_ids = {str(uri).split("#")[-1] for uri in learning_uris}
         
+        # Resolve all prerequisites from a single concepts graph load
+        prereq_map = self.concept_service.get_prerequisites_map(
+            [str(uri).split("#")[-1] for uri in all_concept_uris]
+        )
+        
         nodes = []
         edges = []
         
@@ -62,8 +68,7 @@ class KnowledgeGraphService:
                 continue
             
             # Get prerequisites
-            prereq_uris = self.concept_service.get_concept_prerequisites(concept_id)
-            prereq_ids = [str(p).split("#")[-1] for p in prereq_uris]
+            prereq_ids = [str(p).split("#")[-1] for p in prereq_map[concept_id]]
             
             # Determine category (could be enhanced with actual category data)
             category = self._determine_category(concept_id)
@@ -171,8 +176,9 @@ class KnowledgeGraphService:
     
     async def get_user_stats(self, user_id: str) -> dict:
         """Get statistics about user's knowledge."""
-        known_uris = self.user_knowledge_service.get_user_known_concepts(user_id)
-        learning_uris = self.user_knowledge_service.get_user_learning_concepts(user_id)
+        state = self.user_knowledge_service.get_user_state(user_id)
+        known_uris = state["known"]
+        learning_uris = state["learning"]
         all_concept_uris = self.concept_service.get_all_concepts()
         
         total = len(all_concept_uris)
@@ -52,8 +52,8 @@ class LearningPathKG:
             # Ensure user exists in the graph
             self.user_ontology.ensure_user_exists(user_graph, user_id)
 
-            # Create new graph for this learning path
-            path_graph = self.storage.create_graph()
+            # Create new graph for this learning path (scratch graph, merged on save)
+            path_graph = self.storage.create_graph(store="SimpleMemory")
 
             # Add the learning path with user association
             path = self.learning_path_ontology.add_learning_path(
@@ -64,19 +64,20 @@ class LearningPathKG:
             )
 
             # Add concepts to the path with validation
-            concepts_graph = self.storage.load_concepts()
-            added_concepts = 0
+            concepts_graph = self.storage.load_concepts(read_only=True)
+            concepts = []
             for concept_id in concept_ids:
                 try:
                     concept = self.concept_ontology.get_concept_by_id(concepts_graph, concept_id)
                     if concept is not None:
-                        self.learning_path_ontology.add_concept_to_path(path_graph, path, concept)
-                        added_concepts += 1
+                        concepts.append(concept)
                     else:
                         logger.warning(f"Concept not found: {concept_id}")
                 except Exception as e:
                     logger.warning(f"Failed to add concept {concept_id}: {e}")
                     continue
+            self.learning_path_ontology.add_concepts_to_path(path_graph, path, concepts)
+            added_concepts = len(concepts)
 
             # Save the learning path into user's graph
             self.storage.save_learning_path(user_id, thread_id, path_graph)
@@ -166,7 +167,7 @@ class LearningPathKG:
             List of learning path URIRefs (empty list on error)
         """
         try:
-            user_graph = self.storage.load_user_graph(user_id)
+            user_graph = self.storage.load_user_graph(user_id, read_only=True)
             if user_graph is None:
                 logger.warning(f"No user graph found for user {user_id}")
                 return []
@@ -20,8 +20,6 @@ from app.features.learning_path.utils import (
 import logging
 import asyncio
 
-from app.features import learning_path
-
 logger = logging.getLogger(__name__)
 
 # Timeout configuration for LangGraph operations (in seconds)
@@ -135,17 +133,17 @@ class LearningPathService:
         # Get concepts from KG
         concept_uris = await asyncio.to_thread(self.get_learning_path_concepts, user_id, thread_id)
         
+        # Get prerequisites for all concepts from a single graph load
+        concept_ids = [str(concept_uri).split("#")[-1] for concept_uri in concept_uris]
+        prereq_map = await asyncio.to_thread(
+            self.concept_service.get_prerequisites_map,
+            concept_ids
+        )
+        
         # Format concept information
         concepts_info = []
-        for concept_uri in concept_uris:
-            concept_id = str(concept_uri).split("#")[-1]
-            
-            # Get prerequisites
-            prereq_uris = await asyncio.to_thread(
-                self.concept_service.get_concept_prerequisites,
-                concept_id
-            )
-            prereq_ids = [str(p).split("#")[-1] for p in prereq_uris]
+        for concept_id in concept_ids:
+            prereq_ids = [str(p).split("#")[-1] for p in prereq_map[concept_id]]
             
             concepts_info.append({
                 "id": concept_id,
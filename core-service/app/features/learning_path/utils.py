@@ -7,6 +7,10 @@ from app.features.concept.service import ConceptService
 
 logger = logging.getLogger(__name__)
 
+def _to_concept_id(concept_name: str) -> str:
+    """Convert a concept name to its KG concept ID (e.g., "Data Types" -> "data_types")."""
+    return concept_name.lower().replace(" ", "_").replace("-", "_")
+
 
 def extract_json_array_from_message(content: str) -> Optional[list]:
     """
@@ -105,8 +109,9 @@ def parse_and_store_concepts(
         return
 
     concept_ids = []
+    specs = []
 
-    # First pass: Create all concepts without prerequisites
+    # Collect all concepts (e.g., "Data Types" -> "data_types")
     for concept_data in concepts_data:
         concept_name = concept_data.get("concept", "")
 
@@ -114,55 +119,37 @@ def parse_and_store_concepts(
             logger.warning(f"Skipping concept with missing name: {concept_data}")
             continue
 
-        # Convert concept name to ID (e.g., "Data Types" -> "data_types")
-        concept_id = concept_name.lower().replace(" ", "_").replace("-", "_")
-
-        try:
-            # Add concept (service handles duplicates)
-            concept_service.add_concept(
-                concept_id=concept_id,
-                label=concept_name,
-                description=f"Concept for learning path: {topic}"
-            )
-            concept_ids.append(concept_id)
-        except Exception as e:
-            logger.warning(f"Failed to create concept '{concept_id}': {e}")
-            concept_ids.append(concept_id)  # Still track it for the learning path
-
-    # Second pass: Add prerequisites (non-fatal — skip invalid prereqs)
-    for concept_data in concepts_data:
-        concept_name = concept_data.get("concept", "")
-        prerequisites = concept_data.get("prerequisites", [])
-
-        if not concept_name or not prerequisites:
-            continue
-
-        concept_id = concept_name.lower().replace(" ", "_").replace("-", "_")
-
-        # Convert prerequisite names to IDs, filtering to only those that exist
+        concept_id = _to_concept_id(concept_name)
+        concept_ids.append(concept_id)
+        specs.append({
+            "concept_id": concept_id,
+            "label": concept_name,
+            "description": f"Concept for learning path: {topic}",
+            "prerequisites": concept_data.get("prerequisites") or [],
+        })
+
+    # Keep only prerequisites that are part of this batch (non-fatal — skip invalid prereqs)
+    known_ids = set(concept_ids)
+    for spec in specs:
         prereq_ids = []
-        for prereq in prerequisites:
+        for prereq in spec["prerequisites"]:
             if not prereq:
                 continue
-            prereq_id = prereq.lower().replace(" ", "_").replace("-", "_")
-            if prereq_id in concept_ids:
+            prereq_id = _to_concept_id(prereq)
+            if prereq_id in known_ids:
                 prereq_ids.append(prereq_id)
             else:
                 logger.warning(
                     f"Prerequisite '{prereq}' (id: {prereq_id}) not found in "
                     f"concept list for thread {thread_id}, skipping"
                 )
+        spec["prerequisites"] = prereq_ids
 
-        # Add prerequisites via KG layer directly (bypass validation)
-        if prereq_ids:
-            try:
-                concept_service.kg.create_concept(
-                    concept_id=concept_id,
-                    label=concept_name,
-                    prerequisites=prereq_ids
-                )
-            except Exception as e:
-                logger.warning(f"Failed to add prerequisites for '{concept_id}': {e}")
+    # Add all concepts and prerequisites with one write (service handles duplicates)
+    try:
+        concept_service.add_concepts_bulk(specs)
+    except Exception as e:
+        logger.warning(f"Failed to store concepts for thread {thread_id}: {e}")
 
     # Create learning path in KG — always attempt if we have concepts
     if concept_ids:
@@ -1,6 +1,6 @@
 """Knowledge Graph operations for user knowledge."""
 
-from rdflib import URIRef
+from rdflib import Graph, URIRef
 from app.kg.storage import KGStorage
 from app.kg.ontologies import ConceptOntology, LearningPathOntology, UserKnowledgeOntology
 import logging
@@ -29,21 +29,19 @@ class UserKnowledgeKG:
             user_id: The user identifier
             concept_id: The concept identifier
         """
-        # Load user's graph (contains both knowledge and learning paths)
-        user_graph = self.storage.load_user_graph(user_id)
-        
-        # Ensure user exists
-        user = self.user_ontology.ensure_user_exists(user_graph, user_id)
-        
         # Get concept
-        concepts_graph = self.storage.load_concepts()
+        concepts_graph = self.storage.load_concepts(read_only=True)
         concept = self.concept_ontology.get_concept_by_id(concepts_graph, concept_id)
         
-        # Add knowledge relationship
-        self.user_ontology.add_known_concept(user_graph, user, concept)
+        def apply(user_graph: Graph) -> None:
+            # Ensure user exists
+            user = self.user_ontology.ensure_user_exists(user_graph, user_id)
+            
+            # Add knowledge relationship
+            self.user_ontology.add_known_concept(user_graph, user, concept)
         
-        # Save user graph
-        self.storage.save_user_graph(user_id, user_graph)
+        # Update user's graph (contains both knowledge and learning paths)
+        self.storage.update_user_graph(user_id, apply)
         logger.info(f"Marked concept {concept_id} as known for user {user_id} in KG")
     
     def mark_learning(self, user_id: str, concept_id: str) -> None:
@@ -54,21 +52,19 @@ class UserKnowledgeKG:
             user_id: The user identifier
             concept_id: The concept identifier
         """
-        # Load user's graph
-        user_graph = self.storage.load_user_graph(user_id)
-        
-        # Ensure user exists
-        user = self.user_ontology.ensure_user_exists(user_graph, user_id)
-        
         # Get concept
-        concepts_graph = self.storage.load_concepts()
+        concepts_graph = self.storage.load_concepts(read_only=True)
         concept = self.concept_ontology.get_concept_by_id(concepts_graph, concept_id)
         
-        # Add learning relationship
-        self.user_ontology.add_learning_concept(user_graph, user, concept)
+        def apply(user_graph: Graph) -> None:
+            # Ensure user exists
+            user = self.user_ontology.ensure_user_exists(user_graph, user_id)
+            
+            # Add learning relationship
+            self.user_ontology.add_learning_concept(user_graph, user, concept)
         
-        # Save user graph
-        self.storage.save_user_graph(user_id, user_graph)
+        # Update user's graph
+        self.storage.update_user_graph(user_id, apply)
         logger.info(f"Marked concept {concept_id} as learning for user {user_id} in KG")
     
     def assign_path(self, user_id: str, thread_id: str) -> None:
@@ -80,21 +76,64 @@ class UserKnowledgeKG:
             user_id: The user identifier
             thread_id: The learning path thread identifier
         """
-        # Load user's graph
-        user_graph = self.storage.load_user_graph(user_id)
-        
-        # Ensure user exists
-        user = self.user_ontology.ensure_user_exists(user_graph, user_id)
+        def apply(user_graph: Graph) -> None:
+            # Ensure user exists
+            user = self.user_ontology.ensure_user_exists(user_graph, user_id)
+            
+            # Get learning path URI (should already exist in user's graph)
+            path = self.learning_path_ontology.get_learning_path_by_thread(user_graph, thread_id)
+            
+            # Assign path to user (creates kg:followsPath relationship if not exists)
+            self.user_ontology.add_user_learning_path(user_graph, user, path)
         
-        # Get learning path URI (should already exist in user's graph)
-        path = self.learning_path_ontology.get_learning_path_by_thread(user_graph, thread_id)
+        # Update user's graph
+        self.storage.update_user_graph(user_id, apply)
+        logger.info(f"Assigned learning path {thread_id} to user {user_id} in KG")
+    
+    def apply_user_state(
+        self,
+        user_id: str,
+        known: list[str] = None,
+        learning: list[str] = None
+    ) -> None:
+        """
+        Apply several known/learning concept marks with one load and save.
         
-        # Assign path to user (creates kg:followsPath relationship if not exists)
-        self.user_ontology.add_user_learning_path(user_graph, user, path)
+        Args:
+            user_id: The user identifier
+            known: Concept IDs to mark as known
+            learning: Concept IDs to mark as learning
+        """
+        concepts_graph = self.storage.load_concepts(read_only=True)
+        known_uris = [self.concept_ontology.get_concept_by_id(concepts_graph, c) for c in known or []]
+        learning_uris = [self.concept_ontology.get_concept_by_id(concepts_graph, c) for c in learning or []]
+        
+        def apply(user_graph: Graph) -> None:
+            user = self.user_ontology.ensure_user_exists(user_graph, user_id)
+            for concept in known_uris:
+                self.user_ontology.add_known_concept(user_graph, user, concept)
+            for concept in learning_uris:
+                self.user_ontology.add_learning_concept(user_graph, user, concept)
+        
+        self.storage.update_user_graph(user_id, apply)
+        logger.info(
+            f"Applied state for user {user_id} in KG: {len(known_uris)} known, "
+            f"{len(learning_uris)} learning"
+        )
+    
+    def get_user_state(self, user_id: str) -> dict[str, list[URIRef]]:
+        """
+        Get a user's known and learning concepts from one graph load.
         
-        # Save user graph
-        self.storage.save_user_graph(user_id, user_graph)
-        logger.info(f"Assigned learning path {thread_id} to user {user_id} in KG")
+        Args:
+            user_id: The user identifier
+            
+        Returns:
+            Dict with "known" and "learning" lists of URIRefs
+        """
+        user_graph = self.storage.load_user_graph(user_id, read_only=True)
+        user = self.user_ontology.get_user_by_id(user_graph, user_id)
+        return self.user_ontology.get_user_state(user_graph, user)
     
     def get_known_concepts(self, user_id: str) -> list[URIRef]:
         """
@@ -106,7 +145,7 @@ class UserKnowledgeKG:
         Returns:
             List of concept URIRefs the user knows
         """
-        user_graph = self.storage.load_user_graph(user_id)
+        user_graph = self.storage.load_user_graph(user_id, read_only=True)
         user = self.user_ontology.get_user_by_id(user_graph, user_id)
         return self.user_ontology.get_known_concepts(user_graph, user)
     
@@ -120,7 +159,7 @@ class UserKnowledgeKG:
         Returns:
             List of concept URIRefs the user is learning
         """
-        user_graph = self.storage.load_user_graph(user_id)
+        user_graph = self.storage.load_user_graph(user_id, read_only=True)
         user = self.user_ontology.get_user_by_id(user_graph, user_id)
         return self.user_ontology.get_learning_concepts(user_graph, user)
     
@@ -135,12 +174,12 @@ class UserKnowledgeKG:
         Returns:
             True if user knows the concept, False otherwise
         """
-        user_graph = self.storage.load_user_graph(user_id)
+        user_graph = self.storage.load_user_graph(user_id, read_only=True)
         if len(user_graph) == 0:
             return False
         
         user = self.user_ontology.get_user_by_id(user_graph, user_id)
-        concepts_graph = self.storage.load_concepts()
+        concepts_graph = self.storage.load_concepts(read_only=True)
         concept = self.concept_ontology.get_concept_by_id(concepts_graph, concept_id)
         
         return self.user_ontology.user_knows_concept(user_graph, user, concept)
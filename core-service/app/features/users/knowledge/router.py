@@ -131,13 +131,10 @@ def get_current_user_knowledge(
     """
     user_id = str(current_user.id)
 
-    # Get known concepts
-    known_uris = service.get_user_known_concepts(user_id)
-    known_ids = [str(uri).split("#")[-1] for uri in known_uris]
-
-    # Get learning concepts
-    learning_uris = service.get_user_learning_concepts(user_id)
-    learning_ids = [str(uri).split("#")[-1] for uri in learning_uris]
+    # Get known and learning concepts
+    state = service.get_user_state(user_id)
+    known_ids = [str(uri).split("#")[-1] for uri in state["known"]]
+    learning_ids = [str(uri).split("#")[-1] for uri in state["learning"]]
 
     return UserKnowledgeResponse(
         user_id=user_id,
@@ -165,13 +162,10 @@ def get_user_knowledge(
             detail="Not authorized to access other users' knowledge data"
         )
 
-    # Get known concepts
-    known_uris = service.get_user_known_concepts(user_id)
-    known_ids = [str(uri).split("#")[-1] for uri in known_uris]
-
-    # Get learning concepts
-    learning_uris = service.get_user_learning_concepts(user_id)
-    learning_ids = [str(uri).split("#")[-1] for uri in learning_uris]
+    # Get known and learning concepts
+    state = service.get_user_state(user_id)
+    known_ids = [str(uri).split("#")[-1] for uri in state["known"]]
+    learning_ids = [str(uri).split("#")[-1] for uri in state["learning"]]
 
     return UserKnowledgeResponse(
         user_id=user_id,
@@ -83,6 +83,61 @@ class UserKnowledgeService:
         self.kg.assign_path(user_id, thread_id)
         logger.info(f"Assigned learning path {thread_id} to user {user_id}")
     
+    def apply_user_state(
+        self,
+        user_id: str,
+        known: list[str] = None,
+        learning: list[str] = None
+    ) -> None:
+        """
+        Mark several concepts as known or learning in one batch.
+        
+        Business logic: Same KG and metadata updates as mark_concept_as_known
+        and mark_concept_as_learning, but each file is loaded and saved once.
+        
+        Args:
+            user_id: The user identifier
+            known: Concept IDs to mark as known
+            learning: Concept IDs to mark as learning
+        """
+        known = known or []
+        learning = learning or []
+        
+        # Update KG
+        self.kg.apply_user_state(user_id, known=known, learning=learning)
+        
+        # Update storage: known gets a high score, learning keeps its score or starts at 0.5
+        existing = self.storage.get_user_knowledge(user_id)
+        items = [
+            {"concept_id": concept_id, "mastery": "known", "score": 0.9}
+            for concept_id in known
+        ]
+        items.extend(
+            {
+                "concept_id": concept_id,
+                "mastery": "learning",
+                "score": existing.get(concept_id, {}).get("score", 0.5)
+            }
+            for concept_id in learning
+        )
+        self.storage.save_concept_knowledge_bulk(user_id, items)
+        
+        logger.info(
+            f"User {user_id}: {len(known)} concepts known, {len(learning)} learning"
+        )
+    
+    def get_user_state(self, user_id: str) -> dict[str, list[URIRef]]:
+        """
+        Get a user's known and learning concepts.
+        
+        Args:
+            user_id: The user identifier
+            
+        Returns:
+            Dict with "known" and "learning" lists of URIRefs
+        """
+        return self.kg.get_user_state(user_id)
+    
     def get_user_known_concepts(self, user_id: str) -> list[URIRef]:
         """
         Get all concepts a user knows.
@@ -140,10 +195,6 @@ class UserKnowledgeService:
         # Get knowledge metadata from storage
         knowledge_data = self.storage.get_user_knowledge(user_id)
         
-        # Get concepts from KG
-        known_uris = self.kg.get_known_concepts(user_id)
-        learning_uris = self.kg.get_learning_concepts(user_id)
-        
         # Build items list
         items = []
         for concept_id, metadata in knowledge_data.items():
@@ -101,6 +101,32 @@ class UserKnowledgeStorage:
         self._write_data(data)
         logger.info(f"Saved knowledge for user {user_id}, concept {concept_id}")
     
+    def save_concept_knowledge_bulk(self, user_id: str, items: List[Dict]) -> None:
+        """
+        Save or update knowledge metadata for several concepts in one write.
+        
+        Args:
+            user_id: User identifier
+            items: Dicts with "concept_id", "mastery" and "score" keys
+        """
+        if not items:
+            return
+        
+        data = self._read_data()
+        user_data = data.setdefault(user_id, {})
+        last_updated = datetime.utcnow().isoformat()
+        
+        for item in items:
+            user_data[item["concept_id"]] = {
+                "concept": item["concept_id"],
+                "mastery": item["mastery"],
+                "score": item["score"],
+                "last_updated": last_updated
+            }
+        
+        self._write_data(data)
+        logger.info(f"Saved knowledge for user {user_id}, {len(items)} concepts")
+    
     def update_concept_knowledge(
         self,
         user_id: str,
@@ -363,43 +363,55 @@ class PreferenceService:
         # Lower increments (<0.05) = mark as learning
         target_state = "known" if mastery_increment >= 0.1 else "learning"
         
-        # Update mastery for matched concepts
+        # Check current state once for all matched concepts
+        try:
+            state = knowledge_service.get_user_state(str(user_id))
+            known_ids = {str(uri).split("#")[-1] for uri in state["known"]}
+            learning_ids = {str(uri).split("#")[-1] for uri in state["learning"]}
+        except Exception as e:
+            logger.error(f"Failed to load knowledge state for user {user_id}: {e}")
+            return
+        
+        # Decide which concepts need updating
+        if target_state == "known":
+            to_known = [c for c in matched_concept_ids if c not in known_ids]
+            to_learning = []
+        else:
+            to_known = []
+            to_learning = [
+                c for c in matched_concept_ids
+                if c not in known_ids and c not in learning_ids
+            ]
+        
+        # Apply all updates with a single write per file
         updated_count = 0
-        for concept_id in matched_concept_ids:
+        if to_known or to_learning:
             try:
-                # Check current state
-                known_concepts = knowledge_service.get_user_known_concepts(str(user_id))
-                learning_concepts = knowledge_service.get_user_learning_concepts(str(user_id))
-                
-                known_ids = {str(uri).split("#")[-1] for uri in known_concepts}
-                learning_ids = {str(uri).split("#")[-1] for uri in learning_concepts}
-                
-                # Update state if needed
-                if target_state == "known" and concept_id not in known_ids:
-                    knowledge_service.mark_concept_as_known(str(user_id), concept_id)
-                    updated_count += 1
-                    logger.info(
-                        f"Marked concept '{concept_id}' as KNOWN for user {user_id} "
-                        f"(increment: {mastery_increment:.3f})"
-                    )
-                elif target_state == "learning" and concept_id not in known_ids and concept_id not in learning_ids:
-                    knowledge_service.mark_concept_as_learning(str(user_id), concept_id)
-                    updated_count += 1
-                    logger.info(
-                        f"Marked concept '{concept_id}' as LEARNING for user {user_id} "
-                        f"(increment: {mastery_increment:.3f})"
-                    )
-                elif concept_id in learning_ids and target_state == "known":
-                    # Promote from learning to known
-                    knowledge_service.mark_concept_as_known(str(user_id), concept_id)
-                    updated_count += 1
-                    logger.info(
-                        f"Promoted concept '{concept_id}' from LEARNING to KNOWN for user {user_id}"
-                    )
-                
+                knowledge_service.apply_user_state(
+                    str(user_id),
+                    known=to_known,
+                    learning=to_learning
+                )
+                updated_count = len(to_known) + len(to_learning)
             except Exception as e:
-                logger.error(f"Failed to update concept {concept_id}: {e}")
-                continue
+                logger.error(f"Failed to update concepts {to_known + to_learning}: {e}")
+                to_known, to_learning = [], []
+        
+        for concept_id in to_known:
+            if concept_id in learning_ids:
+                logger.info(
+                    f"Promoted concept '{concept_id}' from LEARNING to KNOWN for user {user_id}"
+                )
+            else:
+                logger.info(
+                    f"Marked concept '{concept_id}' as KNOWN for user {user_id} "
+                    f"(increment: {mastery_increment:.3f})"
+                )
+        for concept_id in to_learning:
+            logger.info(
+                f"Marked concept '{concept_id}' as LEARNING for user {user_id} "
+                f"(increment: {mastery_increment:.3f})"
+            )
         
         if updated_count > 0:
             logger.info(
@@ -2,9 +2,89 @@
 
 from rdflib import Graph, Namespace, URIRef, Literal
 from rdflib.namespace import RDF, RDFS, OWL, XSD
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from app.kg.config import KGConfig
+import threading
+
+# Pre-bound hot predicate (each RDF.type lookup builds a fresh URIRef)
+RDF_TYPE = RDF.type
+
+
+@lru_cache(maxsize=4096)
+def _namespace_term(namespace: str, name: str) -> URIRef:
+    """Build (and memoize) the URIRef for a term in a namespace."""
+    return URIRef(namespace + name)
+
+
+class CachedNamespace(Namespace):
+    """Namespace that reuses URIRefs for repeated terms instead of rebuilding them."""
+    
+    def term(self, name: str) -> URIRef:
+        return _namespace_term(self, name if isinstance(name, str) else "")
+
+
+# In-memory LRU cache of parsed graph files, shared by all KGBase instances.
+# Entries are keyed on the file path and validated against (st_mtime_ns, st_size),
+# so a file changed on disk is reparsed on the next load.
+GRAPH_CACHE_MAXSIZE = 64
+_graph_cache: "OrderedDict[Path, tuple[tuple[int, int], Graph]]" = OrderedDict()
+_graph_cache_lock = threading.Lock()
+
+# Per-file locks serializing read-modify-write cycles within this process
+_file_locks: dict[Path, threading.RLock] = {}
+_file_locks_lock = threading.Lock()
+
+
+def _file_signature(file_path: Path) -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cache_get(file_path: Path, signature: tuple[int, int]) -> Optional[Graph]:
+    """Return the cached graph for a file if it is still fresh."""
+    with _graph_cache_lock:
+        entry = _graph_cache.get(file_path)
+        if entry is None or entry[0] != signature:
+            return None
+        _graph_cache.move_to_end(file_path)
+        return entry[1]
+
+
+def _cache_put(file_path: Path, signature: tuple[int, int], graph: Graph) -> None:
+    """Store a graph in the cache, evicting the least recently used entry."""
+    with _graph_cache_lock:
+        _graph_cache[file_path] = (signature, graph)
+        _graph_cache.move_to_end(file_path)
+        while len(_graph_cache) > GRAPH_CACHE_MAXSIZE:
+            _graph_cache.popitem(last=False)
+
+
+def _cache_invalidate(file_path: Path) -> None:
+    """Remove a file's graph from the cache."""
+    with _graph_cache_lock:
+        _graph_cache.pop(file_path, None)
+
+
+def file_lock(file_path: Path) -> threading.RLock:
+    """Return the lock guarding load-modify-save of a graph file."""
+    with _file_locks_lock:
+        lock = _file_locks.get(file_path)
+        if lock is None:
+            lock = _file_locks[file_path] = threading.RLock()
+        return lock
+
+
+def clear_graph_cache() -> None:
+    """Drop all cached graphs (e.g., after editing files out of band)."""
+    with _graph_cache_lock:
+        _graph_cache.clear()
 
 
 class KGBase:
@@ -13,9 +93,9 @@ class KGBase:
     def __init__(self):
         """Initialize base namespaces."""
         # Define namespaces
-        self.KG = Namespace(KGConfig.KG_NAMESPACE)
-        self.USERS = Namespace(KGConfig.USERS_NAMESPACE)
-        self.PATHS = Namespace(KGConfig.PATHS_NAMESPACE)
+        self.KG = CachedNamespace(KGConfig.KG_NAMESPACE)
+        self.USERS = CachedNamespace(KGConfig.USERS_NAMESPACE)
+        self.PATHS = CachedNamespace(KGConfig.PATHS_NAMESPACE)
         
         # Standard namespaces
         self.RDF = RDF
@@ -23,9 +103,17 @@ class KGBase:
         self.OWL = OWL
         self.XSD = XSD
     
-    def create_graph(self) -> Graph:
-        """Create a new RDF graph with standard namespace bindings."""
-        g = Graph()
+    def create_graph(self, store: str = "default") -> Graph:
+        """
+        Create a new RDF graph with standard namespace bindings.
+        
+        Args:
+            store: rdflib store plugin. "SimpleMemory" has the same
+                   spo/pos/osp indices as the default store but no
+                   per-context bookkeeping, so it is cheaper to fill for
+                   scratch graphs that don't use named contexts.
+        """
+        g = Graph(store=store)
         
         # Bind namespaces
         g.bind("kg", self.KG)
@@ -38,36 +126,74 @@ class KGBase:
         
         return g
     
-    def load_graph(self, file_path: Path) -> Optional[Graph]:
+    def copy_graph(self, graph: Graph) -> Graph:
+        """
+        Create an independent copy of a graph.
+        
+        Args:
+            graph: Graph to copy
+            
+        Returns:
+            A new Graph with the same triples and standard namespace bindings
+        """
+        g = self.create_graph()
+        g += graph
+        return g
+    
+    def load_graph(
+        self,
+        file_path: Path,
+        read_only: bool = False,
+        rdf_format: Optional[str] = None
+    ) -> Optional[Graph]:
         """
         Load an RDF graph from a file.
         
+        Parsed graphs are cached in memory until the file changes, so repeated
+        loads of an unchanged file skip parsing. By default callers receive
+        their own copy and may modify it freely.
+        
         Args:
             file_path: Path to the RDF file
+            read_only: Return the shared cached graph instead of a copy.
+                       The caller must not modify it.
+            rdf_format: Serialization format (defaults to KGConfig.RDF_FORMAT)
             
         Returns:
             Graph object if file exists, None otherwise
         """
-        if not file_path.exists():
+        signature = _file_signature(file_path)
+        if signature is None:
             return None
         
-        g = self.create_graph()
-        g.parse(file_path, format=KGConfig.RDF_FORMAT)
-        return g
+        cached = _cache_get(file_path, signature)
+        if cached is None:
+            cached = self.create_graph()
+            cached.parse(file_path, format=rdf_format or KGConfig.RDF_FORMAT)
+            _cache_put(file_path, signature, cached)
+        return cached if read_only else self.copy_graph(cached)
     
-    def save_graph(self, graph: Graph, file_path: Path) -> None:
+    def save_graph(self, graph: Graph, file_path: Path, rdf_format: Optional[str] = None) -> None:
         """
         Save an RDF graph to a file.
         
         Args:
             graph: RDF graph to save
             file_path: Path where to save the graph
+            rdf_format: Serialization format (defaults to KGConfig.RDF_FORMAT)
         """
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Serialize graph to file
-        graph.serialize(destination=str(file_path), format=KGConfig.RDF_FORMAT)
+        graph.serialize(
+            destination=str(file_path),
+            format=rdf_format or KGConfig.RDF_FORMAT,
+            encoding="utf-8"
+        )
+        
+        # Drop the cached copy; the next load reparses the new contents
+        _cache_invalidate(file_path)
     
     def merge_graphs(self, *graphs: Graph) -> Graph:
         """
@@ -13,7 +13,7 @@ class KGConfig:
     INSTANCES_PATH = BASE_PATH / "instances"
     
     # Instance data paths
-    CONCEPTS_FILE = INSTANCES_PATH / "concepts.ttl"
+    CONCEPTS_FILE = INSTANCES_PATH / "concepts.nt"
     USERS_DIR = INSTANCES_PATH / "users"
     
     # Ontology files
@@ -21,8 +21,10 @@ class KGConfig:
     LEARNING_PATH_ONTOLOGY = ONTOLOGIES_PATH / "learning_path.ttl"
     USER_KNOWLEDGE_ONTOLOGY = ONTOLOGIES_PATH / "user_knowledge.ttl"
     
-    # RDF format
-    RDF_FORMAT = settings.KG_FORMAT
+    # RDF formats
+    RDF_FORMAT = settings.KG_FORMAT  # Hand-edited ontology files
+    INSTANCE_FORMAT = "nt"  # Machine-written instance data (no prefix handling on save/load)
+    LEGACY_INSTANCE_SUFFIX = ".ttl"  # Instance files written before the switch to N-Triples
     
     # Namespaces
     KG_NAMESPACE = "http://learnora.ai/kg#"
@@ -42,7 +44,7 @@ class KGConfig:
         Get the file path for a user's knowledge graph.
         This file now contains both user knowledge and their learning paths.
         """
-        return cls.USERS_DIR / f"user_{user_id}.ttl"
+        return cls.USERS_DIR / f"user_{user_id}.nt"
 
 
 # Ensure directories exist on import
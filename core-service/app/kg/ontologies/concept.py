@@ -1,8 +1,7 @@
 """Helper class for working with Concept ontology."""
 
 from rdflib import Graph, URIRef, Literal
-from rdflib.namespace import RDF, RDFS
-from app.kg.base import KGBase
+from app.kg.base import KGBase, RDF_TYPE
 
 
 class ConceptOntology(KGBase):
@@ -27,10 +26,10 @@ class ConceptOntology(KGBase):
         Returns:
             URIRef of the created concept
         """
-        concept = URIRef(self.KG[concept_id])
+        concept = self.KG[concept_id]
         
         # Add type
-        graph.add((concept, RDF.type, self.KG.Concept))
+        graph.add((concept, RDF_TYPE, self.KG.Concept))
         
         # Add label
         graph.add((concept, self.KG.label, Literal(label)))
@@ -65,7 +64,7 @@ class ConceptOntology(KGBase):
         Returns:
             URIRef of the concept
         """
-        return URIRef(self.KG[concept_id])
+        return self.KG[concept_id]
     
     def get_all_concepts(self, graph: Graph) -> list[URIRef]:
         """
@@ -77,14 +76,8 @@ class ConceptOntology(KGBase):
         Returns:
             List of concept URIRefs
         """
-        query = """
-            SELECT ?concept
-            WHERE {
-                ?concept rdf:type kg:Concept .
-            }
-        """
-        results = graph.query(query, initNs={'rdf': RDF, 'kg': self.KG})
-        return [row.concept for row in results]
+        # Direct lookup on the store's predicate/object index; no SPARQL parse/eval
+        return list(graph.subjects(RDF_TYPE, self.KG.Concept, unique=True))
     
     def get_prerequisites(self, graph: Graph, concept: URIRef) -> list[URIRef]:
         """
@@ -97,15 +90,4 @@ class ConceptOntology(KGBase):
         Returns:
             List of prerequisite concept URIRefs
         """
-        query = """
-            SELECT ?prereq
-            WHERE {
-                ?concept kg:hasPrerequisite ?prereq .
-            }
-        """
-        results = graph.query(
-            query,
-            initBindings={'concept': concept},
-            initNs={'kg': self.KG}
-        )
-        return [row.prereq for row in results]
+        return list(graph.objects(concept, self.KG.hasPrerequisite, unique=True))
@@ -1,9 +1,8 @@
 """Helper class for working with Learning Path ontology."""
 
 from rdflib import Graph, URIRef, Literal
-from rdflib.namespace import RDF
 from datetime import datetime
-from app.kg.base import KGBase
+from app.kg.base import KGBase, RDF_TYPE
 
 
 class LearningPathOntology(KGBase):
@@ -31,11 +30,11 @@ class LearningPathOntology(KGBase):
         Returns:
             URIRef of the created learning path
         """
-        path = URIRef(self.PATHS[thread_id])
-        user = URIRef(self.USERS[user_id])
+        path = self.PATHS[thread_id]
+        user = self.USERS[user_id]
         
         # Add type
-        graph.add((path, RDF.type, self.KG.LearningPath))
+        graph.add((path, RDF_TYPE, self.KG.LearningPath))
         
         # Add properties
         graph.add((path, self.KG.threadId, Literal(thread_id)))
@@ -66,6 +65,23 @@ class LearningPathOntology(KGBase):
         """
         graph.add((path, self.KG.includesConcept, concept))
     
+    def add_concepts_to_path(
+        self,
+        graph: Graph,
+        path: URIRef,
+        concepts: list[URIRef]
+    ) -> None:
+        """
+        Add several concepts to a learning path in one batched insert.
+        
+        Args:
+            graph: The RDF graph to add to
+            path: The learning path URI
+            concepts: The concept URIs to add
+        """
+        includes = self.KG.includesConcept
+        graph.addN((path, includes, concept, graph) for concept in concepts)
+    
     def get_learning_path_by_thread(self, graph: Graph, thread_id: str) -> URIRef:
         """
         Get a learning path URI by thread ID.
@@ -77,7 +93,7 @@ class LearningPathOntology(KGBase):
         Returns:
             URIRef of the learning path
         """
-        return URIRef(self.PATHS[thread_id])
+        return self.PATHS[thread_id]
     
     def get_path_concepts(self, graph: Graph, path: URIRef) -> list[URIRef]:
         """
@@ -90,15 +106,4 @@ class LearningPathOntology(KGBase):
         Returns:
             List of concept URIRefs
         """
-        query = """
-            SELECT ?concept
-            WHERE {
-                ?path kg:includesConcept ?concept .
-            }
-        """
-        results = graph.query(
-            query,
-            initBindings={'path': path},
-            initNs={'kg': self.KG}
-        )
-        return [row.concept for row in results]
+        return list(graph.objects(path, self.KG.includesConcept, unique=True))
@@ -1,9 +1,8 @@
 """Helper class for working with User Knowledge ontology."""
 
 from rdflib import Graph, URIRef, Literal
-from rdflib.namespace import RDF
 from datetime import datetime
-from app.kg.base import KGBase
+from app.kg.base import KGBase, RDF_TYPE
 
 
 class UserKnowledgeOntology(KGBase):
@@ -20,10 +19,10 @@ class UserKnowledgeOntology(KGBase):
         Returns:
             URIRef of the created user
         """
-        user = URIRef(self.USERS[user_id])
+        user = self.USERS[user_id]
         
         # Add type
-        graph.add((user, RDF.type, self.KG.User))
+        graph.add((user, RDF_TYPE, self.KG.User))
         graph.add((user, self.KG.userId, Literal(user_id)))
         
         return user
@@ -86,7 +85,7 @@ class UserKnowledgeOntology(KGBase):
         Returns:
             URIRef of the user
         """
-        return URIRef(self.USERS[user_id])
+        return self.USERS[user_id]
     
     def get_known_concepts(self, graph: Graph, user: URIRef) -> list[URIRef]:
         """
@@ -99,18 +98,7 @@ class UserKnowledgeOntology(KGBase):
         Returns:
             List of concept URIRefs
         """
-        query = """
-            SELECT ?concept
-            WHERE {
-                ?user kg:knows ?concept .
-            }
-        """
-        results = graph.query(
-            query,
-            initBindings={'user': user},
-            initNs={'kg': self.KG}
-        )
-        return [row.concept for row in results]
+        return list(graph.objects(user, self.KG.knows, unique=True))
     
     def get_learning_concepts(self, graph: Graph, user: URIRef) -> list[URIRef]:
         """
@@ -123,18 +111,26 @@ class UserKnowledgeOntology(KGBase):
         Returns:
             List of concept URIRefs
         """
-        query = """
-            SELECT ?concept
-            WHERE {
-                ?user kg:learning ?concept .
-            }
-        """
-        results = graph.query(
-            query,
-            initBindings={'user': user},
-            initNs={'kg': self.KG}
-        )
-        return [row.concept for row in results]
+        return list(graph.objects(user, self.KG.learning, unique=True))
+    
+    def get_user_state(self, graph: Graph, user: URIRef) -> dict[str, list[URIRef]]:
+        """
+        Get a user's known and learning concepts at once.
+        
+        Args:
+            graph: The RDF graph to query
+            user: The user URI
+            
+        Returns:
+            Dict with "known" and "learning" lists of URIRefs
+        """
+        buckets = {self.KG.knows: [], self.KG.learning: []}
+        for _, predicate, obj in graph.triples_choices((user, list(buckets), None)):
+            buckets[predicate].append(obj)
+        return {
+            "known": buckets[self.KG.knows],
+            "learning": buckets[self.KG.learning]
+        }
     
     def user_knows_concept(self, graph: Graph, user: URIRef, concept: URIRef) -> bool:
         """
@@ -161,18 +157,7 @@ class UserKnowledgeOntology(KGBase):
         Returns:
             List of learning path URIRefs
         """
-        query = """
-            SELECT ?path
-            WHERE {
-                ?user kg:followsPath ?path .
-            }
-        """
-        results = graph.query(
-            query,
-            initBindings={'user': user},
-            initNs={'kg': self.KG}
-        )
-        return [row.path for row in results]
+        return list(graph.objects(user, self.KG.followsPath, unique=True))
     
     def ensure_user_exists(self, graph: Graph, user_id: str) -> URIRef:
         """
@@ -185,12 +170,12 @@ class UserKnowledgeOntology(KGBase):
         Returns:
             URIRef of the user
         """
-        user = URIRef(self.USERS[user_id])
+        user = self.USERS[user_id]
         
         # Check if user already exists
-        if (user, RDF.type, self.KG.User) not in graph:
+        if (user, RDF_TYPE, self.KG.User) not in graph:
             # Create user if doesn't exist
-            graph.add((user, RDF.type, self.KG.User))
+            graph.add((user, RDF_TYPE, self.KG.User))
             graph.add((user, self.KG.userId, Literal(user_id)))
         
         return user
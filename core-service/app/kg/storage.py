@@ -1,14 +1,17 @@
 """Storage operations for Knowledge Graph files."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 from rdflib import Graph
-from app.kg.base import KGBase
+from rdflib.graph import ReadOnlyGraphAggregate
+from app.kg.base import KGBase, file_lock
 from app.kg.config import KGConfig
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class KGStorage(KGBase):
     """Handles file-based storage operations for Knowledge Graphs."""
@@ -18,16 +21,52 @@ class KGStorage(KGBase):
         super().__init__()
         KGConfig.ensure_directories()
     
+    # ===== Instance Files =====
+    
+    def _load_instance_graph(self, file_path: Path, read_only: bool = False) -> Optional[Graph]:
+        """
+        Load an instance data file, falling back to its legacy .ttl file.
+        
+        Legacy files were written in KGConfig.RDF_FORMAT; they are picked up
+        transparently and rewritten as N-Triples on the next save.
+        
+        Args:
+            file_path: Path to the N-Triples instance file
+            read_only: Return the shared cached graph; the caller must not modify it
+            
+        Returns:
+            Graph object if either file exists, None otherwise
+        """
+        graph = self.load_graph(file_path, read_only=read_only, rdf_format=KGConfig.INSTANCE_FORMAT)
+        if graph is None:
+            legacy_path = file_path.with_suffix(KGConfig.LEGACY_INSTANCE_SUFFIX)
+            graph = self.load_graph(legacy_path, read_only=read_only, rdf_format=KGConfig.RDF_FORMAT)
+        return graph
+    
+    def _save_instance_graph(self, graph: Graph, file_path: Path) -> None:
+        """Save an instance data file as N-Triples."""
+        self.save_graph(graph, file_path, rdf_format=KGConfig.INSTANCE_FORMAT)
+    
+    def _instance_file_exists(self, file_path: Path) -> bool:
+        """Check if an instance data file (or its legacy .ttl file) exists."""
+        return (
+            file_path.exists()
+            or file_path.with_suffix(KGConfig.LEGACY_INSTANCE_SUFFIX).exists()
+        )
+    
     # ===== Concepts Storage =====
     
-    def load_concepts(self) -> Graph:
+    def load_concepts(self, read_only: bool = False) -> Graph:
         """
         Load the concepts graph.
         
+        Args:
+            read_only: Return the shared cached graph; the caller must not modify it
+        
         Returns:
             Graph with all concepts, or empty graph if file doesn't exist
         """
-        graph = self.load_graph(KGConfig.CONCEPTS_FILE)
+        graph = self._load_instance_graph(KGConfig.CONCEPTS_FILE, read_only=read_only)
         if graph is None:
             logger.info("Concepts file not found, returning empty graph")
             return self.create_graph()
@@ -41,23 +80,43 @@ class KGStorage(KGBase):
         Args:
             graph: Graph containing concept definitions
         """
-        self.save_graph(graph, KGConfig.CONCEPTS_FILE)
+        self._save_instance_graph(graph, KGConfig.CONCEPTS_FILE)
         logger.info(f"Saved concepts graph with {len(graph)} triples")
     
+    def update_concepts(self, mutate_fn: Callable[[Graph], T]) -> T:
+        """
+        Load, modify and save the concepts graph as one locked step.
+        
+        Concurrent updates from other threads wait instead of overwriting
+        each other's changes.
+        
+        Args:
+            mutate_fn: Function that modifies the graph in place
+            
+        Returns:
+            Whatever mutate_fn returns
+        """
+        with file_lock(KGConfig.CONCEPTS_FILE):
+            graph = self.load_concepts()
+            result = mutate_fn(graph)
+            self.save_concepts(graph)
+        return result
+    
     # ===== User Knowledge Storage =====
     
-    def load_user_graph(self, user_id: str) -> Graph:
+    def load_user_graph(self, user_id: str, read_only: bool = False) -> Graph:
         """
         Load a user's complete graph (knowledge + learning paths).
         
         Args:
             user_id: User identifier
+            read_only: Return the shared cached graph; the caller must not modify it
             
         Returns:
             Graph with user's knowledge and learning paths, or empty graph if file doesn't exist
         """
         file_path = KGConfig.get_user_file_path(user_id)
-        graph = self.load_graph(file_path)
+        graph = self._load_instance_graph(file_path, read_only=read_only)
         if graph is None:
             logger.info(f"User graph file not found for user {user_id}, returning empty graph")
             return self.create_graph()
@@ -73,9 +132,26 @@ class KGStorage(KGBase):
             graph: Graph containing user's knowledge and learning paths
         """
         file_path = KGConfig.get_user_file_path(user_id)
-        self.save_graph(graph, file_path)
+        self._save_instance_graph(graph, file_path)
         logger.info(f"Saved user {user_id} graph with {len(graph)} triples")
     
+    def update_user_graph(self, user_id: str, mutate_fn: Callable[[Graph], T]) -> T:
+        """
+        Load, modify and save a user's graph as one locked step.
+        
+        Args:
+            user_id: User identifier
+            mutate_fn: Function that modifies the graph in place
+            
+        Returns:
+            Whatever mutate_fn returns
+        """
+        with file_lock(KGConfig.get_user_file_path(user_id)):
+            graph = self.load_user_graph(user_id)
+            result = mutate_fn(graph)
+            self.save_user_graph(user_id, graph)
+        return result
+    
     def user_graph_exists(self, user_id: str) -> bool:
         """
         Check if a user's graph file exists.
@@ -86,7 +162,7 @@ class KGStorage(KGBase):
         Returns:
             True if file exists, False otherwise
         """
-        return KGConfig.get_user_file_path(user_id).exists()
+        return self._instance_file_exists(KGConfig.get_user_file_path(user_id))
     
     # Legacy method names for backward compatibility
     def load_user_knowledge(self, user_id: str) -> Graph:
@@ -114,23 +190,20 @@ class KGStorage(KGBase):
         Returns:
             Graph with only the specific learning path triples
         """
-        user_graph = self.load_user_graph(user_id)
+        user_graph = self.load_user_graph(user_id, read_only=True)
         
         # Filter to only triples related to this learning path
-        from rdflib import URIRef, Namespace
-        paths_ns = Namespace(KGConfig.PATHS_NAMESPACE)
-        path_uri = paths_ns[thread_id]
+        path_uri = self.PATHS[thread_id]
         
         # Create a new graph with only this learning path's triples
-        path_graph = self.create_graph()
+        # (scratch graph with no named contexts, so skip the context bookkeeping)
+        path_graph = self.create_graph(store="SimpleMemory")
         
         # Get all triples where the path is subject
-        for s, p, o in user_graph.triples((path_uri, None, None)):
-            path_graph.add((s, p, o))
+        path_graph.addN((s, p, o, path_graph) for s, p, o in user_graph.triples((path_uri, None, None)))
         
         # Get all triples where the path is object (e.g., user followsPath)
-        for s, p, o in user_graph.triples((None, None, path_uri)):
-            path_graph.add((s, p, o))
+        path_graph.addN((s, p, o, path_graph) for s, p, o in user_graph.triples((None, None, path_uri)))
         
         logger.info(f"Loaded learning path {thread_id} for user {user_id} with {len(path_graph)} triples")
         return path_graph
@@ -145,26 +218,18 @@ class KGStorage(KGBase):
             thread_id: Learning path thread identifier
             path_graph: Graph containing the learning path data
         """
-        # Load existing user graph
-        user_graph = self.load_user_graph(user_id)
-        
-        # Remove existing triples for this learning path
-        from rdflib import URIRef, Namespace
-        paths_ns = Namespace(KGConfig.PATHS_NAMESPACE)
-        path_uri = paths_ns[thread_id]
+        path_uri = self.PATHS[thread_id]
         
-        # Remove all triples where the path is subject
-        triples_to_remove = list(user_graph.triples((path_uri, None, None)))
-        for triple in triples_to_remove:
-            user_graph.remove(triple)
-        
-        # Merge the new path graph
-        for s, p, o in path_graph:
-            user_graph.add((s, p, o))
+        def replace_path(user_graph: Graph) -> int:
+            # Remove all triples where the path is subject
+            user_graph.remove((path_uri, None, None))
+            
+            # Merge the new path graph
+            user_graph.addN((s, p, o, user_graph) for s, p, o in path_graph)
+            return len(user_graph)
         
-        # Save the updated user graph
-        self.save_user_graph(user_id, user_graph)
-        logger.info(f"Saved learning path {thread_id} for user {user_id} (total graph: {len(user_graph)} triples)")
+        total = self.update_user_graph(user_id, replace_path)
+        logger.info(f"Saved learning path {thread_id} for user {user_id} (total graph: {total} triples)")
     
     def learning_path_exists(self, user_id: str, thread_id: str) -> bool:
         """
@@ -177,18 +242,12 @@ class KGStorage(KGBase):
         Returns:
             True if learning path exists in user's graph, False otherwise
         """
-        if not self.user_graph_exists(user_id):
-            return False
-        
-        user_graph = self.load_user_graph(user_id)
-        from rdflib import URIRef, Namespace
-        paths_ns = Namespace(KGConfig.PATHS_NAMESPACE)
-        path_uri = paths_ns[thread_id]
+        # A missing user file loads as an empty graph, so no separate exists() check
+        user_graph = self.load_user_graph(user_id, read_only=True)
+        path_uri = self.PATHS[thread_id]
         
         # Check if any triples exist for this path
-        for _ in user_graph.triples((path_uri, None, None)):
-            return True
-        return False
+        return (path_uri, None, None) in user_graph
     
     # ===== Ontology Storage =====
     
@@ -196,11 +255,15 @@ class KGStorage(KGBase):
         """
         Load an ontology file.
         
+        Ontologies don't change at runtime, so the parsed graph is shared
+        through the graph cache and returned as a read-only view.
+        
         Args:
             ontology_name: Name of ontology ('concept', 'learning_path', 'user_knowledge')
             
         Returns:
-            Graph with ontology, or empty graph if file doesn't exist
+            Read-only graph with ontology (empty if the name is unknown or
+            the file doesn't exist)
         """
         ontology_files = {
             'concept': KGConfig.CONCEPT_ONTOLOGY,
@@ -211,11 +274,11 @@ class KGStorage(KGBase):
         file_path = ontology_files.get(ontology_name)
         if file_path is None:
             logger.warning(f"Unknown ontology name: {ontology_name}")
-            return self.create_graph()
+            return ReadOnlyGraphAggregate([self.create_graph()])
         
-        graph = self.load_graph(file_path)
+        graph = self.load_graph(file_path, read_only=True)
         if graph is None:
             logger.info(f"Ontology file not found for {ontology_name}, returning empty graph")
-            return self.create_graph()
+            return ReadOnlyGraphAggregate([self.create_graph()])
         logger.info(f"Loaded {ontology_name} ontology with {len(graph)} triples")
-        return graph
+        return ReadOnlyGraphAggregate([graph])